@@ -19,10 +19,7 @@ from typing import Any, ClassVar, Dict, Optional
 
 from securesystemslib import exceptions as sslib_exceptions
 from securesystemslib import hash as sslib_hash
-from securesystemslib.interface import (
-    import_ed25519_privatekey_from_file,
-    import_ed25519_publickey_from_file,
-)
+from securesystemslib.interface import import_ed25519_publickey_from_file
 from securesystemslib.keys import generate_ed25519_key
 from securesystemslib.signer import (
     SecretsHandler,
@@ -68,29 +65,38 @@ class TestMetadata(unittest.TestCase):
         # Create a temporary directory to store the repository, metadata, and
         # target files.  'temporary_directory' must be deleted in
         # TearDownClass() so that temporary files are always removed, even when
-        # exceptions occur.
-        cls.temporary_directory = tempfile.mkdtemp(dir=os.getcwd())
+        # exceptions occur. Unlike the server-based tests this suite does not
+        # need its files under the current working directory: use the default
+        # temporary directory (often memory-backed, and tunable with TMPDIR).
+        cls.temporary_directory = tempfile.mkdtemp()
 
         test_repo_data = os.path.join(
             os.path.dirname(os.path.realpath(__file__)), "repository_data"
         )
 
+        # copyfile instead of the copy2 default skips copying file metadata,
+        # which the tests do not care about
         cls.repo_dir = os.path.join(cls.temporary_directory, "repository")
         shutil.copytree(
-            os.path.join(test_repo_data, "repository"), cls.repo_dir
+            os.path.join(test_repo_data, "repository"),
+            cls.repo_dir,
+            copy_function=shutil.copyfile,
         )
 
         cls.keystore_dir = os.path.join(cls.temporary_directory, "keystore")
         shutil.copytree(
-            os.path.join(test_repo_data, "keystore"), cls.keystore_dir
+            os.path.join(test_repo_data, "keystore"),
+            cls.keystore_dir,
+            copy_function=shutil.copyfile,
         )
 
-        # Load keys into memory
+        # Load keys into memory. Import from the original keystore so the
+        # decrypted keys are shared with other test modules.
         cls.keystore = {}
         for role in ["delegation", Snapshot.type, Targets.type, Timestamp.type]:
-            cls.keystore[role] = import_ed25519_privatekey_from_file(
-                os.path.join(cls.keystore_dir, role + "_key"),
-                password="password",
+            cls.keystore[role] = utils.import_ed25519_privatekey(
+                os.path.join(test_repo_data, "keystore", role + "_key"),
+                "password",
             )
 
     @classmethod
@@ -29,6 +29,7 @@ class TestFetcher(unittest.TestCase):
     """Test RequestsFetcher class."""
 
     server_process_handler: ClassVar[utils.TestServerProcess]
+    fetcher: ClassVar[RequestsFetcher]
 
     @classmethod
     def setUpClass(cls) -> None:
@@ -38,6 +39,13 @@ class TestFetcher(unittest.TestCase):
         """
         cls.server_process_handler = utils.TestServerProcess(log=logger)
 
+        # Instantiate a concrete instance of FetcherInterface once for the
+        # whole class: RequestsFetcher keeps per-origin sessions with
+        # keep-alive connections, so reuse avoids re-establishing a TCP
+        # connection for every test.
+        cls.fetcher = RequestsFetcher()
+        cls.default_chunk_size = cls.fetcher.chunk_size
+
         cls.file_contents = b"junk data"
         cls.file_length = len(cls.file_contents)
         with tempfile.NamedTemporaryFile(
@@ -59,17 +67,14 @@ class TestFetcher(unittest.TestCase):
         os.remove(cls.target_file.name)
 
     def setUp(self) -> None:
-        # Instantiate a concrete instance of FetcherInterface
-        self.fetcher = RequestsFetcher()
+        # Restore the default chunk size for tests that modify it
+        self.fetcher.chunk_size = self.default_chunk_size
 
-    # Simple fetch.
+    # Simple fetch: consume the stream as the chunks arrive instead of
+    # taking a round-trip through a temporary file.
     def test_fetch(self) -> None:
-        with tempfile.TemporaryFile() as temp_file:
-            for chunk in self.fetcher.fetch(self.url):
-                temp_file.write(chunk)
-
-            temp_file.seek(0)
-            self.assertEqual(self.file_contents, temp_file.read())
+        data = b"".join(self.fetcher.fetch(self.url))
+        self.assertEqual(self.file_contents, data)
 
     # URL data downloaded in more than one chunk
     def test_fetch_in_chunks(self) -> None:
@@ -83,16 +88,10 @@ class TestFetcher(unittest.TestCase):
         )
         self.assertEqual(expected_chunks_count, 3)
 
-        chunks_count = 0
-        with tempfile.TemporaryFile() as temp_file:
-            for chunk in self.fetcher.fetch(self.url):
-                temp_file.write(chunk)
-                chunks_count += 1
-
-            temp_file.seek(0)
-            self.assertEqual(self.file_contents, temp_file.read())
-            # Check that we calculate chunks as expected
-            self.assertEqual(chunks_count, expected_chunks_count)
+        chunks = list(self.fetcher.fetch(self.url))
+        self.assertEqual(self.file_contents, b"".join(chunks))
+        # Check that we calculate chunks as expected
+        self.assertEqual(len(chunks), expected_chunks_count)
 
     # Incorrect URL parsing
     def test_url_parsing(self) -> None:
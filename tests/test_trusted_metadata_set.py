@@ -6,10 +6,6 @@ import unittest
 from datetime import datetime
 from typing import Callable, ClassVar, Dict, List, Optional, Tuple
 
-from securesystemslib.interface import (
-    import_ed25519_privatekey_from_file,
-    import_rsa_privatekey_from_file,
-)
 from securesystemslib.signer import SSlibSigner
 
 from tests import utils
@@ -51,7 +47,10 @@ class TestTrustedMetadataSet(unittest.TestCase):
         metadata = Metadata.from_bytes(cls.metadata[rolename])
         modification_func(metadata.signed)
         metadata.sign(cls.keystore[rolename])
-        return metadata.to_bytes(JSONSerializer(validate=True))
+        # No need for the costly validating serializer here: the returned
+        # bytes are fed to TrustedMetadataSet, which deserializes them and
+        # would surface a malformed result anyway
+        return metadata.to_bytes(JSONSerializer())
 
     @classmethod
     def setUpClass(cls) -> None:
@@ -74,13 +73,13 @@ class TestTrustedMetadataSet(unittest.TestCase):
             utils.TESTS_DIR, "repository_data", "keystore"
         )
         cls.keystore = {}
-        root_key_dict = import_rsa_privatekey_from_file(
-            os.path.join(keystore_dir, Root.type + "_key"), password="password"
+        root_key_dict = utils.import_rsa_privatekey(
+            os.path.join(keystore_dir, Root.type + "_key"), "password"
         )
         cls.keystore[Root.type] = SSlibSigner(root_key_dict)
         for role in ["delegation", Snapshot.type, Targets.type, Timestamp.type]:
-            key_dict = import_ed25519_privatekey_from_file(
-                os.path.join(keystore_dir, role + "_key"), password="password"
+            key_dict = utils.import_ed25519_privatekey(
+                os.path.join(keystore_dir, role + "_key"), "password"
             )
             cls.keystore[role] = SSlibSigner(key_dict)
 
@@ -12,10 +12,9 @@ import shutil
 import sys
 import tempfile
 import unittest
-from typing import Callable, ClassVar, List
+from typing import Callable, ClassVar, List, Optional
 from unittest.mock import MagicMock, patch
 
-from securesystemslib.interface import import_rsa_privatekey_from_file
 from securesystemslib.signer import SSlibSigner
 
 from tests import utils
@@ -29,30 +28,109 @@ from tuf.api.metadata import (
     Targets,
     Timestamp,
 )
+from tuf.api.serialization.json import JSONSerializer
 
 logger = logging.getLogger(__name__)
 
 
+def _clone_tree(source: str, destination: str) -> None:
+    """Clone a tree of small test files as cheaply as possible.
+
+    Hardlinking avoids re-reading and re-writing every metadata, key and
+    target blob for each test. Sharing file contents between clones is
+    safe because metadata writes in tests replace files instead of
+    modifying them in place. Fall back to a regular copy on filesystems
+    without hardlink support.
+    """
+    try:
+        shutil.copytree(source, destination, copy_function=os.link)
+    except OSError:
+        shutil.rmtree(destination, ignore_errors=True)
+        # copyfile instead of the copy2 default: tests do not care about
+        # file metadata, so skip the extra stat/utime/chmod syscalls
+        shutil.copytree(source, destination, copy_function=shutil.copyfile)
+
+
+_server_process_handler: Optional[utils.TestServerProcess] = None
+
+
+def setUpModule() -> None:
+    """Launch a SimpleHTTPServer shared by all test classes in this module.
+
+    The server serves the current working directory, so each test class
+    can create its own trees under it without needing its own server
+    subprocess.
+    """
+    global _server_process_handler  # pylint: disable=global-statement
+    _server_process_handler = utils.TestServerProcess(log=logger)
+
+
+def tearDownModule() -> None:
+    """Stop the shared server process and perform clean up."""
+    assert _server_process_handler is not None
+    _server_process_handler.clean()
+
+
 class TestUpdater(unittest.TestCase):
     """Test the Updater class from 'tuf/ngclient/updater.py'."""
 
     # pylint: disable=too-many-instance-attributes
     server_process_handler: ClassVar[utils.TestServerProcess]
+    golden_directory: ClassVar[str]
+    root_signer: ClassVar[SSlibSigner]
 
     @classmethod
     def setUpClass(cls) -> None:
         cls.tmp_test_root_dir = tempfile.mkdtemp(dir=os.getcwd())
 
-        # Launch a SimpleHTTPServer
+        # Copy the original repository files provided in the test folder once
+        # per class into a pristine "golden" tree. setUp() clones the golden
+        # tree for each test, which is considerably cheaper than re-copying
+        # the originals for every test method.
+        # The 'repository_data' directory is expected to exist in 'tuf.tests/'.
+        original_repository_files = os.path.join(
+            utils.TESTS_DIR, "repository_data"
+        )
+        original_client = os.path.join(
+            original_repository_files,
+            "client",
+            "test_repository1",
+            "metadata",
+            "current",
+        )
+
+        cls.golden_directory = os.path.join(cls.tmp_test_root_dir, "golden")
+        shutil.copytree(
+            os.path.join(original_repository_files, "repository"),
+            os.path.join(cls.golden_directory, "repository"),
+            copy_function=shutil.copyfile,
+        )
+        shutil.copytree(
+            original_client,
+            os.path.join(cls.golden_directory, "client"),
+            copy_function=shutil.copyfile,
+        )
+
+        # Import the root signing key once per class: decrypting the key
+        # file is expensive and the key never changes between tests.
+        root_key_dict = utils.import_rsa_privatekey(
+            os.path.join(original_repository_files, "keystore", "root_key"),
+            "password",
+        )
+        cls.root_signer = SSlibSigner(root_key_dict)
+
+        # Reuse the module-level SimpleHTTPServer
         # Test cases will request metadata and target files that have been
         # pre-generated in 'tuf/tests/repository_data', and are copied to
         # CWD/tmp_test_root_dir/*
-        cls.server_process_handler = utils.TestServerProcess(log=logger)
+        assert _server_process_handler is not None
+        cls.server_process_handler = _server_process_handler
 
     @classmethod
     def tearDownClass(cls) -> None:
-        # Cleans resources, flush the logged lines (if any) and remove test dir
-        cls.server_process_handler.clean()
+        # Flush the logged lines (if any) and remove the test dir. The
+        # server process itself is stopped in tearDownModule().
+        cls.server_process_handler.flush_log()
         shutil.rmtree(cls.tmp_test_root_dir)
 
     def setUp(self) -> None:
@@ -61,38 +139,25 @@ class TestUpdater(unittest.TestCase):
         # tearDownClass after the server has released all resources.
         self.tmp_test_dir = tempfile.mkdtemp(dir=self.tmp_test_root_dir)
 
-        # Copy the original repository files provided in the test folder so that
-        # any modifications are restricted to the copies.
-        # The 'repository_data' directory is expected to exist in 'tuf.tests/'.
-        original_repository_files = os.path.join(
-            utils.TESTS_DIR, "repository_data"
-        )
-
-        original_repository = os.path.join(
-            original_repository_files, "repository"
-        )
-        original_keystore = os.path.join(original_repository_files, "keystore")
-        original_client = os.path.join(
-            original_repository_files,
-            "client",
-            "test_repository1",
-            "metadata",
-            "current",
-        )
-
         # Save references to the often-needed client repository directories.
         # Test cases need these references to access metadata and target files.
         self.repository_directory = os.path.join(
             self.tmp_test_dir, "repository"
         )
-        self.keystore_directory = os.path.join(self.tmp_test_dir, "keystore")
         self.client_directory = os.path.join(self.tmp_test_dir, "client")
 
-        # Copy the original 'repository', 'client', and 'keystore' directories
-        # to the temporary repository the test cases can use.
-        shutil.copytree(original_repository, self.repository_directory)
-        shutil.copytree(original_client, self.client_directory)
-        shutil.copytree(original_keystore, self.keystore_directory)
+        # Clone the golden 'repository' and 'client' directories to the
+        # temporary repository so that any modifications are restricted to
+        # the clones. The keystore needs no per-test copy: tests only read
+        # the root signing key, imported once in setUpClass().
+        _clone_tree(
+            os.path.join(self.golden_directory, "repository"),
+            self.repository_directory,
+        )
+        _clone_tree(
+            os.path.join(self.golden_directory, "client"),
+            self.client_directory,
+        )
 
         # 'path/to/tmp/repository' -> 'localhost:8001/tmp/repository'.
         repository_basepath = self.repository_directory[len(os.getcwd()) :]
@@ -109,17 +174,21 @@ class TestUpdater(unittest.TestCase):
         self.dl_dir = tempfile.mkdtemp(dir=self.tmp_test_dir)
         # Creating a repository instance.  The test cases will use this client
         # updater to refresh metadata, fetch target files, etc.
-        self.updater = ngclient.Updater(
+        self.updater = self._create_updater()
+
+    def tearDown(self) -> None:
+        # Logs stdout and stderr from the sever subprocess.
+        self.server_process_handler.flush_log()
+
+    def _create_updater(self) -> ngclient.Updater:
+        """Create an Updater instance for the test repository."""
+        return ngclient.Updater(
             metadata_dir=self.client_directory,
             metadata_base_url=self.metadata_url,
             target_dir=self.dl_dir,
             target_base_url=self.targets_url,
         )
 
-    def tearDown(self) -> None:
-        # Logs stdout and stderr from the sever subprocess.
-        self.server_process_handler.flush_log()
-
     def _modify_repository_root(
         self,
         modification_func: Callable[[Metadata], None],
@@ -133,22 +202,21 @@ class TestUpdater(unittest.TestCase):
         modification_func(root)
         if bump_version:
             root.signed.version += 1
-        root_key_path = os.path.join(self.keystore_directory, "root_key")
-        root_key_dict = import_rsa_privatekey_from_file(
-            root_key_path, password="password"
-        )
-        signer = SSlibSigner(root_key_dict)
-        root.sign(signer)
-        root.to_file(
-            os.path.join(self.repository_directory, "metadata", "root.json")
-        )
-        root.to_file(
-            os.path.join(
-                self.repository_directory,
-                "metadata",
-                f"{root.signed.version}.root.json",
-            )
-        )
+        root.sign(self.root_signer)
+        # Serialize root only once and write the resulting bytes to both
+        # destinations: this also guarantees the version-prefixed and
+        # non-prefixed files are identical byte-for-byte.
+        root_data = root.to_bytes(JSONSerializer())
+        metadata_dir = os.path.join(self.repository_directory, "metadata")
+        for filename in ["root.json", f"{root.signed.version}.root.json"]:
+            filepath = os.path.join(metadata_dir, filename)
+            # Unlink before writing: 'root.json' may be a hardlink into the
+            # golden tree and opening it with "wb" would truncate the shared
+            # content in place (to_file() used to do this removal for us)
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            with open(filepath, "wb") as f:
+                f.write(root_data)
 
     def _assert_files(self, roles: List[str]) -> None:
         """Assert that local metadata files exist for 'roles'"""
@@ -203,22 +271,29 @@ class TestUpdater(unittest.TestCase):
         path = self.updater.find_cached_target(info3)
         self.assertEqual(path, os.path.join(self.dl_dir, info3.path))
 
-    def test_refresh_with_only_local_root(self) -> None:
-        os.remove(os.path.join(self.client_directory, "timestamp.json"))
-        os.remove(os.path.join(self.client_directory, "snapshot.json"))
-        os.remove(os.path.join(self.client_directory, "targets.json"))
-        os.remove(os.path.join(self.client_directory, "role1.json"))
-        os.remove(os.path.join(self.client_directory, "role2.json"))
-        os.remove(os.path.join(self.client_directory, "1.root.json"))
+    local_root_refresh_cases: utils.DataSet = {
+        "explicit refresh": True,
+        "implicit refresh": False,
+    }
+
+    @utils.run_sub_tests_with_dataset(local_root_refresh_cases)
+    def test_refresh_with_only_local_root(self, explicit_refresh: bool) -> None:
+        # Start each case from a fresh updater with only root metadata on disk
+        updater = self._create_updater()
+        for filename in os.listdir(self.client_directory):
+            if filename != "root.json":
+                os.remove(os.path.join(self.client_directory, filename))
         self._assert_files([Root.type])
 
-        self.updater.refresh()
-        self._assert_files(
-            [Root.type, Snapshot.type, Targets.type, Timestamp.type]
-        )
+        if explicit_refresh:
+            updater.refresh()
+            self._assert_files(
+                [Root.type, Snapshot.type, Targets.type, Timestamp.type]
+            )
 
-        # Get targetinfo for 'file3.txt' listed in the delegated role1
-        self.updater.get_targetinfo("file3.txt")
+        # Get targetinfo for 'file3.txt' listed in the delegated role1:
+        # this refreshes implicitly if refresh() was not called above
+        updater.get_targetinfo("file3.txt")
         expected_files = [
             "role1",
             Root.type,
@@ -228,20 +303,6 @@ class TestUpdater(unittest.TestCase):
         ]
         self._assert_files(expected_files)
 
-    def test_implicit_refresh_with_only_local_root(self) -> None:
-        os.remove(os.path.join(self.client_directory, "timestamp.json"))
-        os.remove(os.path.join(self.client_directory, "snapshot.json"))
-        os.remove(os.path.join(self.client_directory, "targets.json"))
-        os.remove(os.path.join(self.client_directory, "role1.json"))
-        os.remove(os.path.join(self.client_directory, "role2.json"))
-        os.remove(os.path.join(self.client_directory, "1.root.json"))
-        self._assert_files(["root"])
-
-        # Get targetinfo for 'file3.txt' listed in the delegated role1
-        self.updater.get_targetinfo("file3.txt")
-        expected_files = ["role1", "root", "snapshot", "targets", "timestamp"]
-        self._assert_files(expected_files)
-
     def test_both_target_urls_not_set(self) -> None:
         # target_base_url = None and Updater._target_base_url = None
         updater = ngclient.Updater(
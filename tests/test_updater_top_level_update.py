@@ -11,7 +11,8 @@ import os
 import sys
 import tempfile
 import unittest
-from typing import Iterable, Optional
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
 from unittest.mock import MagicMock, Mock, call, patch
 
 from tests import utils
@@ -71,6 +72,22 @@ class TestRefresh(unittest.TestCase):
     def tearDown(self) -> None:
         self.temp_dir.cleanup()
 
+    @staticmethod
+    @contextmanager
+    def _days_from_now(days: int) -> Iterator[None]:
+        """Run the block with the clock patched 'days' into the future.
+
+        A single patch of 'datetime.datetime' replaces the previous
+        per-test combination of a wrapping mock decorator and a nested
+        patch context.
+        """
+        mock_time = Mock(wraps=datetime.datetime)
+        mock_time.utcnow.return_value = (
+            datetime.datetime.utcnow() + datetime.timedelta(days=days)
+        )
+        with patch("datetime.datetime", mock_time):
+            yield
+
     def _run_refresh(self) -> Updater:
         """Create a new Updater instance and refresh"""
         if self.dump_dir is not None:
@@ -309,8 +326,7 @@ class TestRefresh(unittest.TestCase):
 
         self._assert_files_exist([Root.type])
 
-    @patch.object(datetime, "datetime", wraps=datetime.datetime)
-    def test_expired_timestamp_version_rollback(self, mock_time: Mock) -> None:
+    def test_expired_timestamp_version_rollback(self) -> None:
         """Verifies that local timestamp is used in rollback checks even if it is expired.
 
         The timestamp updates and rollback checks are performed
@@ -334,10 +350,7 @@ class TestRefresh(unittest.TestCase):
 
         self.sim.timestamp.version = 1
 
-        mock_time.utcnow.return_value = (
-            datetime.datetime.utcnow() + datetime.timedelta(days=18)
-        )
-        with patch("datetime.datetime", mock_time):
+        with self._days_from_now(18):
             # Check that a rollback protection is performed even if
             # local timestamp has expired
             with self.assertRaises(BadVersionNumberError):
@@ -345,8 +358,7 @@ class TestRefresh(unittest.TestCase):
 
         self._assert_version_equals(Timestamp.type, 2)
 
-    @patch.object(datetime, "datetime", wraps=datetime.datetime)
-    def test_expired_timestamp_snapshot_rollback(self, mock_time: Mock) -> None:
+    def test_expired_timestamp_snapshot_rollback(self) -> None:
         """Verifies that rollback protection is done even if local timestamp has expired.
 
         The snapshot updates and rollback protection checks are performed
@@ -373,10 +385,7 @@ class TestRefresh(unittest.TestCase):
         self.sim.update_snapshot()
         self.sim.timestamp.expires = now + datetime.timedelta(days=21)
 
-        mock_time.utcnow.return_value = (
-            datetime.datetime.utcnow() + datetime.timedelta(days=18)
-        )
-        with patch("datetime.datetime", mock_time):
+        with self._days_from_now(18):
             # Assert that rollback protection is done even if
             # local timestamp has expired
             with self.assertRaises(BadVersionNumberError):
@@ -739,8 +748,7 @@ class TestRefresh(unittest.TestCase):
         expected_calls = [("root", 2), ("timestamp", None)]
         self.assertListEqual(self.sim.fetch_tracker.metadata, expected_calls)
 
-    @patch.object(datetime, "datetime", wraps=datetime.datetime)
-    def test_expired_metadata(self, mock_time: Mock) -> None:
+    def test_expired_metadata(self) -> None:
         """Verifies that expired local timestamp/snapshot can be used for
         updating from remote.
 
@@ -764,10 +772,7 @@ class TestRefresh(unittest.TestCase):
 
         # Mocking time so that local timestam has expired
         # but the new timestamp has not
-        mock_time.utcnow.return_value = (
-            datetime.datetime.utcnow() + datetime.timedelta(days=18)
-        )
-        with patch("datetime.datetime", mock_time):
+        with self._days_from_now(18):
             self._run_refresh()
 
         # Assert that the final version of timestamp/snapshot is version 2
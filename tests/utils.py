@@ -22,6 +22,7 @@
 
 import argparse
 import errno
+import functools
 import logging
 import os
 import queue
@@ -35,6 +36,11 @@ import warnings
 from contextlib import contextmanager
 from typing import IO, Any, Callable, Dict, Iterator, List, Optional
 
+from securesystemslib.interface import (
+    import_ed25519_privatekey_from_file,
+    import_rsa_privatekey_from_file,
+)
+
 logger = logging.getLogger(__name__)
 
 # May be used to reliably read other files in tests dir regardless of cwd
@@ -155,6 +161,27 @@ def configure_test_logging(argv: List[str]) -> None:
     logging.basicConfig(level=loglevel)
 
 
+@functools.lru_cache(maxsize=None)
+def import_ed25519_privatekey(path: str, password: str) -> Dict[str, Any]:
+    """Import an encrypted ed25519 private key, caching the result.
+
+    Decrypting a key file runs a deliberately slow key derivation
+    function. The keys in the test keystore never change, so each
+    (path, password) pair needs to be decrypted only once per test run.
+    Callers must not modify the returned key dict.
+    """
+    return import_ed25519_privatekey_from_file(path, password)
+
+
+@functools.lru_cache(maxsize=None)
+def import_rsa_privatekey(path: str, password: str) -> Dict[str, Any]:
+    """Import an encrypted RSA private key, caching the result.
+
+    See import_ed25519_privatekey() for the rationale and caveats.
+    """
+    return import_rsa_privatekey_from_file(path, password)
+
+
 def cleanup_dir(path: str) -> None:
     """Delete all files inside a directory"""
     for filepath in [
@@ -68,6 +68,10 @@ _SNAPSHOT = "snapshot"
 _TARGETS = "targets"
 _TIMESTAMP = "timestamp"
 
+# Datetime format of the 'expires' field in TUF metadata (UTC, no
+# microseconds). Used for both parsing and formatting.
+_EXPIRES_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
 # pylint: disable=too-many-lines
 
 logger = logging.getLogger(__name__)
@@ -545,7 +549,7 @@ class Signed(metaclass=abc.ABCMeta):
         # Convert 'expires' TUF metadata string to a datetime object, which is
         # what the constructor expects and what we store. The inverse operation
         # is implemented in '_common_fields_to_dict'.
-        expires = datetime.strptime(expires_str, "%Y-%m-%dT%H:%M:%SZ")
+        expires = datetime.strptime(expires_str, _EXPIRES_FORMAT)
 
         return version, spec_version, expires
 
@@ -559,7 +563,9 @@ class Signed(metaclass=abc.ABCMeta):
             "_type": self._type,
             "version": self.version,
             "spec_version": self.spec_version,
-            "expires": self.expires.isoformat() + "Z",
+            # Format in one strftime() call: identical output to
+            # 'isoformat() + "Z"' since 'expires' has no microseconds
+            "expires": self.expires.strftime(_EXPIRES_FORMAT),
             **self.unrecognized_fields,
         }
 